@@ -573,7 +573,7 @@ class Agent:
         return "\n\n".join(blocks)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _ToolAutoOutcome:
     kind: str
     text: str = ""
@@ -617,7 +617,7 @@ def _build_llm(settings: AgentSettings, tape_store: AsyncTapeStore, tape_context
     )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Args:
     positional: list[str]
     kwargs: dict[str, Any]
@@ -1,5 +1,5 @@
 import sys
-from datetime import UTC, datetime
+import time
 from pathlib import Path
 from typing import cast
 
@@ -134,7 +134,7 @@ class BuiltinImpl:
             message.kind = "command"
             return content
         context = field_of(message, "context_str")
-        now = datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
+        now = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
         context_prefix = f"{context}\n---Date: {now}---\n" if context else ""
         text = f"{context_prefix}{content}"
 
@@ -16,8 +16,9 @@ DEFAULT_MAX_TOKENS = 16384
 
 
 def provider_specific(setting_name: str) -> Callable[[], dict[str, str] | None]:
+    setting_regex = re.compile(rf"^BUB_(.+)_{setting_name.upper()}$")
+
     def default_factory() -> dict[str, str] | None:
-        setting_regex = re.compile(rf"^BUB_(.+)_{setting_name.upper()}$")
         loaded_env = os.environ
         result: dict[str, str] = {}
         for key, value in loaded_env.items():
@@ -4,8 +4,8 @@ import asyncio
 import contextlib
 import os
 import shutil
-import uuid
 from dataclasses import dataclass, field
+from secrets import token_hex
 
 
 @dataclass(slots=True)
@@ -14,12 +14,12 @@ class ManagedShell:
     cmd: str
     cwd: str | None
     process: asyncio.subprocess.Process
-    output_chunks: list[str] = field(default_factory=list)
+    output_buffer: bytearray = field(default_factory=bytearray)
     read_tasks: list[asyncio.Task[None]] = field(default_factory=list)
 
     @property
     def output(self) -> str:
-        return "".join(self.output_chunks)
+        return self.output_buffer.decode("utf-8", errors="replace")
 
     @property
     def returncode(self) -> int | None:
@@ -44,7 +44,7 @@ class ShellManager:
             stderr=asyncio.subprocess.PIPE,
             executable=self.SHELL,
         )
-        shell = ManagedShell(shell_id=f"bash-{uuid.uuid4().hex[:8]}", cmd=cmd, cwd=cwd, process=process)
+        shell = ManagedShell(shell_id=f"bash-{token_hex(4)}", cmd=cmd, cwd=cwd, process=process)
         shell.read_tasks.extend([
             asyncio.create_task(self._drain_stream(shell, process.stdout)),
             asyncio.create_task(self._drain_stream(shell, process.stderr)),
@@ -98,7 +98,7 @@ class ShellManager:
         if stream is None:
             return
         while chunk := await stream.read(4096):
-            shell.output_chunks.append(chunk.decode("utf-8", errors="replace"))
+            shell.output_buffer.extend(chunk)
 
 
 shell_manager = ShellManager()
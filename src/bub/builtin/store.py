@@ -266,14 +266,16 @@ class TapeFile:
 
     def read(self) -> list[TapeEntry]:
         with self._lock:
-            return self._read_locked()
+            self._sync_locked()
+            return list(self._read_entries)
 
-    def _read_locked(self) -> list[TapeEntry]:
-        if not self.path.exists():
+    def _sync_locked(self) -> None:
+        try:
+            file_size = self.path.stat().st_size
+        except FileNotFoundError:
             self._reset()
-            return []
+            return
 
-        file_size = self.path.stat().st_size
         if file_size < self._read_offset:
             # The file was truncated or replaced, so cached entries are stale.
             self._reset()
@@ -293,8 +295,6 @@ class TapeFile:
                     self._read_entries.append(entry)
             self._read_offset = handle.tell()
 
-        return list(self._read_entries)
-
     @staticmethod
     def entry_from_payload(payload: object) -> TapeEntry | None:
         if not isinstance(payload, dict):
@@ -320,8 +320,8 @@ class TapeFile:
     def append(self, entry: TapeEntry) -> None:
         with self._lock:
             # Keep cache and offset in sync before allocating new IDs.
-            self._read_locked()
-            with self.path.open("a", encoding="utf-8") as handle:
+            self._sync_locked()
+            with self.path.open("a", encoding="utf-8", newline="\n") as handle:
                 next_id = self._next_id()
                 stored = TapeEntry(next_id, entry.kind, dict(entry.payload), dict(entry.meta), entry.date)
                 handle.write(json.dumps(asdict(stored), ensure_ascii=False) + "\n")
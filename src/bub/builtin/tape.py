@@ -1,9 +1,9 @@
 import contextlib
 import hashlib
 import json
+import time
 from collections.abc import AsyncGenerator
 from dataclasses import asdict
-from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any, cast
 
@@ -13,7 +13,7 @@ from republic import LLM, AsyncTapeStore, Tape, TapeEntry, TapeQuery
 from bub.builtin.store import ForkTapeStore
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TapeInfo:
     """Runtime tape info summary."""
 
@@ -25,7 +25,7 @@ class TapeInfo:
     last_token_usage: int | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AnchorSummary:
     """Rendered anchor summary."""
 
@@ -85,10 +85,10 @@ class TapeService:
 
     async def _archive(self, tape_name: str) -> Path:
         tape = self._llm.tape(tape_name)
-        stamp = datetime.now(UTC).strftime("%Y%m%dT%H%M%SZ")
+        stamp = time.strftime("%Y%m%dT%H%M%SZ", time.gmtime())
         self._archive_path.mkdir(parents=True, exist_ok=True)
         archive_path = self._archive_path / f"{tape.name}.jsonl.{stamp}.bak"
-        with archive_path.open("w", encoding="utf-8") as f:
+        with archive_path.open("w", encoding="utf-8", newline="\n") as f:
             for entry in await tape.query_async.all():
                 f.write(json.dumps(asdict(entry), ensure_ascii=False) + "\n")
         return archive_path
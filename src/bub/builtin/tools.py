@@ -2,8 +2,8 @@ from __future__ import annotations
 
 import asyncio
 import json
-import uuid
 from pathlib import Path
+from secrets import token_hex
 from typing import TYPE_CHECKING, Literal, cast
 
 from pydantic import BaseModel, Field
@@ -261,7 +261,7 @@ async def run_subagent(param: SubAgentInput, *, context: ToolContext) -> str:
     if param.session == "inherit":
         subagent_session = session_id
     elif param.session == "temp":
-        subagent_session = f"temp/{uuid.uuid4().hex[:8]}"
+        subagent_session = f"temp/{token_hex(4)}"
     else:
         subagent_session = param.session
     state = {**context.state, "session_id": subagent_session}
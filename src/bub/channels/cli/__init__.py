@@ -1,7 +1,7 @@
 import asyncio
 import contextlib
+import time
 from collections.abc import AsyncGenerator, AsyncIterable
-from datetime import datetime
 from hashlib import md5
 from pathlib import Path
 
@@ -186,7 +186,7 @@ class CliChannel(Channel):
 
     def _render_bottom_toolbar(self) -> FormattedText:
         info = self._last_tape_info
-        now = datetime.now().strftime("%H:%M")
+        now = time.strftime("%H:%M")
         left = f"{now}  mode:{self._mode}"
         right = (
             f"model:{self._agent.settings.model}  "
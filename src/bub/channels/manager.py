@@ -53,9 +53,9 @@ class ChannelManager:
         self._settings = ensure_config(ChannelSettings)
         self._stream_output = stream_output if stream_output is not None else self._settings.stream_output
         if enabled_channels is not None:
-            self._enabled_channels = list(enabled_channels)
+            self._enabled_channels = frozenset(enabled_channels)
         else:
-            self._enabled_channels = self._settings.enabled_channels.split(",")
+            self._enabled_channels = frozenset(self._settings.enabled_channels.split(","))
         self._messages = asyncio.Queue[ChannelMessage]()
         self._ongoing_tasks: dict[str, set[asyncio.Task]] = {}
         self._session_handlers: dict[str, MessageHandler] = {}
@@ -1,5 +1,8 @@
+import os
+import stat
 from collections.abc import Callable
 from pathlib import Path
+from secrets import token_hex
 from typing import Any
 
 from pydantic_settings import BaseSettings, PydanticBaseSettingsSource
@@ -73,9 +76,28 @@ def save(config_file: Path, config_data: dict[str, Any]) -> None:
     import yaml
 
     validated = validate(config_data)
-    config_file.parent.mkdir(parents=True, exist_ok=True)
-    with config_file.open("w", encoding="utf-8") as f:
-        yaml.safe_dump(validated, f, sort_keys=False)
+    # Resolve symlinks so a linked config (e.g. from a dotfiles repo) is updated in place.
+    target = config_file.resolve()
+    target.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        existing_mode: int | None = stat.S_IMODE(target.stat().st_mode)
+    except FileNotFoundError:
+        existing_mode = None
+    # Write beside the target and swap it in, so a crash never leaves a truncated config behind.
+    # An existing config keeps its mode; a new one gets the umask default like a plain open("w").
+    tmp_file = target.with_name(f".{target.name}.{token_hex(4)}.tmp")
+    fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666 if existing_mode is None else 0o600)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            yaml.safe_dump(validated, f, sort_keys=False)
+            f.flush()
+            os.fsync(f.fileno())
+        if existing_mode is not None:
+            os.chmod(tmp_file, existing_mode)
+        os.replace(tmp_file, target)
+    except BaseException:
+        tmp_file.unlink(missing_ok=True)
+        raise
 
 
 def ensure_config[C: BaseSettings](config_cls: type[C]) -> C:
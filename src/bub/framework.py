@@ -29,7 +29,7 @@ DEFAULT_HOME = Path.home() / ".bub"
 DEFAULT_CONFIG_FILE = (DEFAULT_HOME / "config.yml").resolve()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PluginStatus:
     is_success: bool
     detail: str | None = None
@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+import copy
+import functools
+import os
 import re
+import stat
 import string
 import sys
 import warnings
-from collections.abc import Collection
-from dataclasses import dataclass, field
+from collections.abc import Collection, Iterator
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 from typing import Any
 
@@ -18,9 +22,11 @@ LEGACY_SKILLS_DIR = ".agent/skills"
 SKILL_FILE_NAME = "SKILL.md"
 SKILL_SOURCES = ("project", "global", "builtin")
 SKILL_NAME_PATTERN = re.compile(r"^[a-z0-9]+(?:-[a-z0-9]+)*$")
+# Prefer the LibYAML-backed loader when PyYAML was built with it.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SkillMetadata:
     """Discovered skill metadata."""
 
@@ -31,13 +37,13 @@ class SkillMetadata:
     metadata: dict[str, Any] = field(default_factory=dict)
 
     def body(self) -> str:
-        front_matter_pattern = re.compile(r"^---\s*\n.*?\n---\s*\n", re.DOTALL)
         try:
-            template = string.Template(self.location.read_text(encoding="utf-8").strip())
+            content = self.location.read_text(encoding="utf-8").strip()
         except OSError:
             return ""
-        content = template.safe_substitute({"SKILL_DIR": str(self.location.parent), "PYTHON": sys.executable})
-        return front_matter_pattern.sub("", content, count=1).strip()
+        _, body = _split_frontmatter(content)
+        template = string.Template(body)
+        return template.safe_substitute({"SKILL_DIR": str(self.location.parent), "PYTHON": sys.executable}).strip()
 
 
 def discover_skills(workspace_path: Path) -> list[SkillMetadata]:
@@ -45,11 +51,7 @@ def discover_skills(workspace_path: Path) -> list[SkillMetadata]:
 
     skills_by_name: dict[str, SkillMetadata] = {}
     for root, source in _iter_skill_roots(workspace_path):
-        if not root.is_dir():
-            continue
-        for skill_dir in sorted(root.iterdir()):
-            if not skill_dir.is_dir():
-                continue
+        for skill_dir in _iter_skill_dirs(root):
             metadata = _read_skill(skill_dir, source=source)
             if metadata is None:
                 continue
@@ -60,11 +62,41 @@ def discover_skills(workspace_path: Path) -> list[SkillMetadata]:
     return sorted(skills_by_name.values(), key=lambda item: item.name.casefold())
 
 
+def _iter_skill_dirs(root: Path) -> list[Path]:
+    # scandir exposes the entry type from the directory listing, avoiding a stat() per child.
+    try:
+        with os.scandir(root) as entries:
+            names = sorted(entry.name for entry in entries if entry.is_dir())
+    except OSError:
+        return []
+    return [root / name for name in names]
+
+
 def _read_skill(skill_dir: Path, *, source: str) -> SkillMetadata | None:
     skill_file = skill_dir / SKILL_FILE_NAME
-    if not skill_file.is_file():
+    try:
+        file_stat = skill_file.stat()
+    except OSError:
+        return None
+    if not stat.S_ISREG(file_stat.st_mode):
+        return None
+    # The stat fields key the cache, so an edited or replaced SKILL.md is re-read while an unchanged one is not.
+    key = (skill_file, source, file_stat.st_mtime_ns, file_stat.st_size, file_stat.st_ino)
+    skill = _cached_skill(key)
+    if skill is None:
         return None
+    # Hand out a private copy so a caller mutating metadata cannot corrupt the cached entry.
+    return replace(skill, metadata=copy.deepcopy(skill.metadata))
 
+
+@functools.lru_cache(maxsize=256)
+def _cached_skill(key: tuple[Path, str, int, int, int]) -> SkillMetadata | None:
+    skill_file, source, *_ = key
+    return _load_skill(skill_file, source=source)
+
+
+def _load_skill(skill_file: Path, *, source: str) -> SkillMetadata | None:
+    skill_dir = skill_file.parent
     try:
         content = skill_file.read_text(encoding="utf-8").strip()
     except OSError:
@@ -85,20 +117,34 @@ def _read_skill(skill_dir: Path, *, source: str) -> SkillMetadata | None:
     )
 
 
+def _iter_frontmatter_fences(content: str) -> Iterator[tuple[str, str]]:
+    """Yield (payload, body) for each candidate closing ``---`` fence, nearest first."""
+    first_end = content.find("\n")
+    if first_end == -1 or content[:first_end].strip() != "---":
+        return
+    fence = content.find("\n---", first_end)
+    while fence != -1:
+        line_end = content.find("\n", fence + 4)
+        if line_end == -1:
+            line_end = len(content)
+        if not content[fence + 4 : line_end].strip():
+            yield content[first_end + 1 : fence], content[line_end + 1 :]
+        fence = content.find("\n---", fence + 1)
+
+
+def _split_frontmatter(content: str) -> tuple[str | None, str]:
+    """Split content into its frontmatter payload (None when absent) and the remaining body."""
+    return next(_iter_frontmatter_fences(content), (None, content))
+
+
 def _parse_frontmatter(content: str) -> dict[str, Any]:
-    lines = content.splitlines()
-    if not lines or lines[0].strip() != "---":
-        return {}
-
-    for idx, line in enumerate(lines[1:], start=1):
-        if line.strip() == "---":
-            payload = "\n".join(lines[1:idx])
-            try:
-                parsed = yaml.safe_load(payload)
-            except yaml.YAMLError:
-                parsed = {}
-            if isinstance(parsed, dict):
-                return {str(key).lower(): value for key, value in parsed.items()}
+    for payload, _ in _iter_frontmatter_fences(content):
+        try:
+            parsed = yaml.load(payload, Loader=_YAML_LOADER)  # noqa: S506
+        except yaml.YAMLError:
+            return {}
+        if isinstance(parsed, dict):
+            return {str(key).lower(): value for key, value in parsed.items()}
     return {}
 
 
@@ -170,12 +216,10 @@ def render_skills_prompt(skills: list[SkillMetadata], expanded_skills: Collectio
         return ""
     lines = ["<available_skills>"]
     for skill in skills:
-        line = f"- {skill.name}: {skill.description}"
+        lines.append(f"- {skill.name}: {skill.description}")
         if skill.name in expanded_skills:
-            line += f"\n  Location: {skill.location}"
-            body = skill.body()
-            if body:
-                line += f"\n{body}"
-        lines.append(line)
+            lines.append(f"  Location: {skill.location}")
+            if body := skill.body():
+                lines.append(body)
     lines.append("</available_skills>")
     return "\n".join(lines)
@@ -144,21 +144,25 @@ def _tool_name_index() -> dict[str, str]:
 
 def resolve_tool_name(name: str) -> str | None:
     """Resolve a user/model-provided tool name to the runtime registry name."""
+    return _resolve_with_index(name, _tool_name_index())
+
+
+def _resolve_with_index(name: str, index: dict[str, str]) -> str | None:
     key = name.strip().casefold()
     if not key:
         return None
-    return _tool_name_index().get(key)
+    return index.get(key)
 
 
 def _resolve_explicit_tool_names(names: Iterable[str]) -> tuple[set[str], set[str]]:
+    index = _tool_name_index()
     resolved: set[str] = set()
     unknown: set[str] = set()
     for name in names:
-        normalized_name = name.strip()
-        if resolved_name := resolve_tool_name(normalized_name):
+        if resolved_name := _resolve_with_index(name, index):
             resolved.add(resolved_name)
         else:
-            unknown.add(normalized_name)
+            unknown.add(name.strip())
     return resolved, unknown
 
 
@@ -192,8 +196,6 @@ def render_tools_prompt(tools: Iterable[Tool]) -> str:
         return ""
     lines = []
     for tool in tools:
-        line = f"- {_to_model_name(tool.name)}"
-        if tool.description:
-            line += f": {tool.description}"
-        lines.append(line)
+        name = _to_model_name(tool.name)
+        lines.append(f"- {name}: {tool.description}" if tool.description else f"- {name}")
     return f"<available_tools>\n{'\n'.join(lines)}\n</available_tools>"
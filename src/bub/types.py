@@ -20,7 +20,7 @@ class OutboundChannelRouter(Protocol):
     async def quit(self, session_id: str) -> None: ...
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TurnResult:
     """Result of one complete message turn."""
 
@@ -19,7 +19,8 @@ import sys
 from pathlib import Path
 
 MAX_SKILL_NAME_LENGTH = 64
-ALLOWED_RESOURCES = {"scripts", "references", "assets"}
+NON_ALNUM_PATTERN = re.compile(r"[^a-z0-9]+")
+REPEATED_HYPHEN_PATTERN = re.compile(r"-{2,}")
 
 SKILL_TEMPLATE = """---
 name: {skill_name}
@@ -191,13 +192,21 @@ Example asset files from other skills:
 Note: This is a text placeholder. Actual assets can be any file type.
 """
 
+# Example file written into each resource directory: (filename, template, needs formatting, file mode).
+RESOURCE_EXAMPLES = {
+    "scripts": ("example.py", EXAMPLE_SCRIPT, True, 0o755),
+    "references": ("api_reference.md", EXAMPLE_REFERENCE, True, None),
+    "assets": ("example_asset.txt", EXAMPLE_ASSET, False, None),
+}
+ALLOWED_RESOURCES = frozenset(RESOURCE_EXAMPLES)
+
 
 def normalize_skill_name(skill_name):
     """Normalize a skill name to lowercase hyphen-case."""
     normalized = skill_name.strip().lower()
-    normalized = re.sub(r"[^a-z0-9]+", "-", normalized)
+    normalized = NON_ALNUM_PATTERN.sub("-", normalized)
     normalized = normalized.strip("-")
-    normalized = re.sub(r"-{2,}", "-", normalized)
+    normalized = REPEATED_HYPHEN_PATTERN.sub("-", normalized)
     return normalized
 
 
@@ -229,28 +238,17 @@ def create_resource_dirs(skill_dir, skill_name, skill_title, resources, include_
     for resource in resources:
         resource_dir = skill_dir / resource
         resource_dir.mkdir(exist_ok=True)
-        if resource == "scripts":
-            if include_examples:
-                example_script = resource_dir / "example.py"
-                example_script.write_text(EXAMPLE_SCRIPT.format(skill_name=skill_name))
-                example_script.chmod(0o755)
-                print("[OK] Created scripts/example.py")
-            else:
-                print("[OK] Created scripts/")
-        elif resource == "references":
-            if include_examples:
-                example_reference = resource_dir / "api_reference.md"
-                example_reference.write_text(EXAMPLE_REFERENCE.format(skill_title=skill_title))
-                print("[OK] Created references/api_reference.md")
-            else:
-                print("[OK] Created references/")
-        elif resource == "assets":
-            if include_examples:
-                example_asset = resource_dir / "example_asset.txt"
-                example_asset.write_text(EXAMPLE_ASSET)
-                print("[OK] Created assets/example_asset.txt")
-            else:
-                print("[OK] Created assets/")
+        if not include_examples:
+            print(f"[OK] Created {resource}/")
+            continue
+        filename, template, formatted, mode = RESOURCE_EXAMPLES[resource]
+        example_file = resource_dir / filename
+        if formatted:
+            template = template.format(skill_name=skill_name, skill_title=skill_title)
+        example_file.write_text(template)
+        if mode is not None:
+            example_file.chmod(mode)
+        print(f"[OK] Created {resource}/{filename}")
 
 
 def init_skill(skill_name, path, resources, include_examples, interface_overrides):
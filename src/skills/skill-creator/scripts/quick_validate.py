@@ -16,6 +16,10 @@ from pathlib import Path
 import yaml
 
 MAX_SKILL_NAME_LENGTH = 64
+ALLOWED_PROPERTIES = frozenset({"name", "description", "license", "allowed-tools", "metadata"})
+ALLOWED_PROPERTIES_TEXT = ", ".join(sorted(ALLOWED_PROPERTIES))
+FRONTMATTER_PATTERN = re.compile(r"^---\n(.*?)\n---", re.DOTALL)
+NAME_PATTERN = re.compile(r"^[a-z0-9-]+$")
 
 
 def validate_skill(skill_path):
@@ -30,7 +34,7 @@ def validate_skill(skill_path):
     if not content.startswith("---"):
         return False, "No YAML frontmatter found"
 
-    match = re.match(r"^---\n(.*?)\n---", content, re.DOTALL)
+    match = FRONTMATTER_PATTERN.match(content)
     if not match:
         return False, "Invalid frontmatter format"
 
@@ -43,15 +47,13 @@ def validate_skill(skill_path):
     except yaml.YAMLError as e:
         return False, f"Invalid YAML in frontmatter: {e}"
 
-    allowed_properties = {"name", "description", "license", "allowed-tools", "metadata"}
-
-    unexpected_keys = set(frontmatter.keys()) - allowed_properties
+    unexpected_keys = frontmatter.keys() - ALLOWED_PROPERTIES
     if unexpected_keys:
-        allowed = ", ".join(sorted(allowed_properties))
         unexpected = ", ".join(sorted(unexpected_keys))
         return (
             False,
-            f"Unexpected key(s) in SKILL.md frontmatter: {unexpected}. Allowed properties are: {allowed}",
+            f"Unexpected key(s) in SKILL.md frontmatter: {unexpected}. "
+            f"Allowed properties are: {ALLOWED_PROPERTIES_TEXT}",
         )
 
     if "name" not in frontmatter:
@@ -64,7 +66,7 @@ def validate_skill(skill_path):
         return False, f"Name must be a string, got {type(name).__name__}"
     name = name.strip()
     if name:
-        if not re.match(r"^[a-z0-9-]+$", name):
+        if not NAME_PATTERN.match(name):
             return (
                 False,
                 f"Name '{name}' should be hyphen-case (lowercase letters, digits, and hyphens only)",
@@ -94,6 +94,20 @@ async def test_background_bash_exposes_output_via_bash_output(tmp_path) -> None:
     assert "done" in output
 
 
+@pytest.mark.asyncio
+async def test_shell_output_decodes_utf8_sequence_split_across_reads() -> None:
+    manager = ShellManager()
+    command = _python_shell(
+        "import sys, time; out = sys.stdout.buffer; out.write(b'\\xe2\\x82'); out.flush(); "
+        "time.sleep(0.2); out.write(b'\\xac'); out.flush()"
+    )
+
+    shell = await manager.start(cmd=command, cwd=None)
+    shell = await manager.wait_closed(shell.shell_id)
+
+    assert shell.output == "\u20ac"
+
+
 @pytest.mark.asyncio
 async def test_kill_bash_terminates_background_process_and_releases_shell(tmp_path) -> None:
     started = await bash.run(
@@ -73,5 +73,51 @@ def test_save_writes_yaml_and_refreshes_loaded_config(tmp_path: Path) -> None:
             assert loaded["telegram"]["token"] == expected_token
             assert configure.ensure_config(AgentSettings).model == "openai:gpt-5"
             assert configure.ensure_config(TelegramSettings).token == expected_token
+            assert sorted(path.name for path in tmp_path.iterdir()) == ["config.yml"]
         finally:
             os.chdir(previous_cwd)
+
+
+def test_save_preserves_existing_config_file_mode(tmp_path: Path) -> None:
+    config_file = tmp_path / "config.yml"
+    config_file.write_text("model: openai:gpt-5\n", encoding="utf-8")
+    config_file.chmod(0o600)
+
+    configure.save(config_file, {"model": "openai:gpt-5"})
+
+    assert config_file.stat().st_mode & 0o777 == 0o600
+
+
+def test_save_removes_temp_file_when_dump_fails(tmp_path: Path) -> None:
+    config_file = tmp_path / "config.yml"
+    config_file.write_text("model: openai:gpt-5\n", encoding="utf-8")
+
+    with patch("yaml.safe_dump", side_effect=RuntimeError("boom")), pytest.raises(RuntimeError):
+        configure.save(config_file, {"model": "openai:gpt-5"})
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["config.yml"]
+    assert config_file.read_text(encoding="utf-8") == "model: openai:gpt-5\n"
+
+
+def test_save_applies_umask_to_new_config_file(tmp_path: Path) -> None:
+    config_file = tmp_path / "config.yml"
+    previous_umask = os.umask(0o022)
+    try:
+        configure.save(config_file, {"model": "openai:gpt-5"})
+    finally:
+        os.umask(previous_umask)
+
+    assert config_file.stat().st_mode & 0o777 == 0o644
+
+
+def test_save_writes_through_config_symlink(tmp_path: Path) -> None:
+    target = tmp_path / "dotfiles" / "config.yml"
+    target.parent.mkdir()
+    target.write_text("model: openai:gpt-4\n", encoding="utf-8")
+    config_file = tmp_path / "config.yml"
+    config_file.symlink_to(target)
+
+    configure.save(config_file, {"model": "openai:gpt-5"})
+
+    assert config_file.is_symlink()
+    assert target.read_text(encoding="utf-8") == "model: openai:gpt-5\n"
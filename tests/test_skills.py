@@ -1,8 +1,10 @@
+import os
 from pathlib import Path
 
 from bub.skills import (
     SKILL_FILE_NAME,
     SkillMetadata,
+    _load_skill,
     _parse_frontmatter,
     _read_skill,
     discover_skills,
@@ -46,6 +48,18 @@ def test_skill_metadata_body_strips_frontmatter(tmp_path: Path) -> None:
     assert metadata.body() == "Line 1\nLine 2"
 
 
+def test_skill_metadata_body_is_empty_for_frontmatter_only_file(tmp_path: Path) -> None:
+    skill_file = _write_skill(tmp_path, "empty-skill", body="")
+    metadata = SkillMetadata(name="empty-skill", description="Demo", location=skill_file, source="project")
+    assert metadata.body() == ""
+
+
+def test_skill_metadata_body_keeps_non_newline_line_breaks(tmp_path: Path) -> None:
+    skill_file = _write_skill(tmp_path, "breaks-skill", body="x\u2028y\x0cz")
+    metadata = SkillMetadata(name="breaks-skill", description="Demo", location=skill_file, source="project")
+    assert metadata.body() == "x\u2028y\x0cz"
+
+
 def test_read_skill_rejects_invalid_metadata_field_type(tmp_path: Path) -> None:
     skill_dir = tmp_path / "bad-skill"
     skill_dir.mkdir()
@@ -55,11 +69,55 @@ def test_read_skill_rejects_invalid_metadata_field_type(tmp_path: Path) -> None:
     assert _read_skill(skill_dir, source="project") is None
 
 
+def test_read_skill_reloads_after_skill_file_changes(tmp_path: Path, monkeypatch) -> None:
+    loads: list[Path] = []
+
+    def counting_load(skill_file: Path, *, source: str) -> SkillMetadata | None:
+        loads.append(skill_file)
+        return _load_skill(skill_file, source=source)
+
+    monkeypatch.setattr("bub.skills._load_skill", counting_load)
+    skill_file = _write_skill(tmp_path, "cached-skill", description="first")
+    first = _read_skill(tmp_path / "cached-skill", source="project")
+    assert first is not None
+    assert first.description == "first"
+    assert _read_skill(tmp_path / "cached-skill", source="project") == first
+    assert len(loads) == 1
+
+    mtime_ns = skill_file.stat().st_mtime_ns
+    _write_skill(tmp_path, "cached-skill", description="second")
+    os.utime(skill_file, ns=(mtime_ns + 1_000_000_000, mtime_ns + 1_000_000_000))
+
+    second = _read_skill(tmp_path / "cached-skill", source="project")
+    assert second is not None
+    assert second.description == "second"
+    assert len(loads) == 2
+
+
+def test_read_skill_returns_metadata_isolated_from_cache(tmp_path: Path) -> None:
+    _write_skill(tmp_path, "shared-skill", metadata={"owner": "bub"})
+    first = _read_skill(tmp_path / "shared-skill", source="project")
+    assert first is not None
+    first.metadata["metadata"]["owner"] = "someone-else"
+    first.metadata["extra"] = "value"
+
+    second = _read_skill(tmp_path / "shared-skill", source="project")
+    assert second is not None
+    assert second.metadata["metadata"] == {"owner": "bub"}
+    assert "extra" not in second.metadata
+
+
 def test_parse_frontmatter_returns_empty_on_invalid_yaml() -> None:
     content = "---\nname: [broken\n---\nbody\n"
     assert _parse_frontmatter(content) == {}
 
 
+def test_parse_frontmatter_only_closes_on_unindented_fence() -> None:
+    content = "---\nname: demo\ndescription: |\n  text\n  ---\n  more\n---\nbody\n"
+    assert _parse_frontmatter(content) == {"name": "demo", "description": "text\n---\nmore"}
+    assert _parse_frontmatter("---\nname: demo\n ---\nbody\n") == {}
+
+
 def test_discover_skills_prefers_project_over_global_and_builtin(tmp_path: Path, monkeypatch) -> None:
     project_root = tmp_path / "project"
     global_root = tmp_path / "global"